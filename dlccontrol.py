@@ -6,28 +6,74 @@
 
 
 import os
+import sys
+import copy
 import time
 import enum
+import atexit
+import contextlib
 import json
-import argparse
+import math
+import asyncio
+import functools
 import datetime
-import numpy as np
-import toptica.lasersdk as lasersdk
-import toptica.lasersdk.dlcpro.v2_4_0 as dlcsdk
-from toptica.lasersdk import decop, client
 from typing import Union, Tuple, List, Any
 
+try:
+    import orjson  # optional, faster saving and loading of parameter files
+except ImportError:
+    orjson = None
+
+# The laser SDK is slow to import, so it is imported by ``_import_sdk()`` when
+# the first ``DLCcontrol`` is created rather than with the module
+decop = client = dlcsdk = None
+_DECOP_TYPES = {}
+"""Python types of the values of the SDK parameter classes, filled in by
+``_import_sdk()``"""
+
 IP = "192.168.100.100"
 """The default IP when initialising a ``DLCcontrol()``"""
 MAINTENANCE_PSW = "CAUTION"
 """Factory default password for maintenance mode user level"""
 
 
+def _import_sdk():
+    """Import the parts of the Toptica laser SDK used by the module"""
+    global decop, client, dlcsdk
+    if dlcsdk is None:
+        from toptica.lasersdk import decop, client
+        import toptica.lasersdk.dlcpro.v2_4_0 as dlcsdk
+
+        _DECOP_TYPES.update(
+            {
+                dlcsdk.DecopBoolean: bool,
+                dlcsdk.MutableDecopBoolean: bool,
+                dlcsdk.SettableDecopBoolean: bool,
+                dlcsdk.DecopInteger: int,
+                dlcsdk.MutableDecopInteger: int,
+                dlcsdk.SettableDecopInteger: int,
+                dlcsdk.DecopReal: float,
+                dlcsdk.MutableDecopReal: float,
+                dlcsdk.SettableDecopReal: float,
+                dlcsdk.DecopString: str,
+                dlcsdk.MutableDecopString: str,
+                dlcsdk.SettableDecopString: str,
+                dlcsdk.DecopBinary: bytes,
+                dlcsdk.MutableDecopBinary: bytes,
+                dlcsdk.SettableDecopBinary: bytes,
+            }
+        )
+
+
 class OutOfRangeError(ValueError):
     """Custom out of range errors for when a parameter is outside the permitted
     range"""
 
-    def __init__(self, value: Any, parameter_name: str, permitted_range: List[Any]):
+    __slots__ = ("value", "parameter_name", "range", "message")
+
+    def __init__(
+        self, value: Any, parameter_name: str, permitted_range: Tuple[float, float]
+    ):
         self.value = value
         self.parameter_name = parameter_name
         self.range = permitted_range
@@ -38,38 +84,39 @@ class OutOfRangeError(ValueError):
         super().__init__(self.message)
 
 
-def _check_value(val: float, parameter_name: str, permitted_range: List[float]):
-    """Check that a value is within a given range, raise error if not
-
-    Raises
-    ------
-    OutOfRangeError
-        If ``val`` is not within the two values of the ``permitted_range``
-        list
-    """
-    if not permitted_range[0] <= val <= permitted_range[1]:
-        raise OutOfRangeError(val, parameter_name, permitted_range)
-
-
-def _print_dict(the_dict: dict, indent: int = 0, header: str = ""):
-    """Recursive dictionary printing"""
-    longest_key_len = len(max(the_dict.keys(), key=len))
-    line = "-" * max(len(header), longest_key_len, 50)
+def _format_dict(the_dict: dict, indent: int, lines: List[str]):
+    """Recursively append the lines of a formatted dictionary to ``lines``"""
+    longest_key_len = max(map(len, the_dict), default=0)
     indent_spaces = " | " * indent
-    if not indent:
-        print("")
-        if header:
-            print(header)
-        print(line)
     for key, val in the_dict.items():
         if isinstance(val, dict):
-            print(f"{indent_spaces}{key}:")
-            _print_dict(val, indent=(indent + 1))
+            lines.append(f"{indent_spaces}{key}:")
+            _format_dict(val, indent + 1, lines)
         else:
-            print(indent_spaces, end="")
-            print(f"{key:<{longest_key_len}}: {val}")
-    if not indent:
-        print(line)
+            lines.append(f"{indent_spaces}{key.ljust(longest_key_len)}: {val}")
+
+
+def _print_dict(the_dict: dict, header: str = ""):
+    """Recursive dictionary printing, written to stdout in one go"""
+    line = "-" * max(len(header), max(map(len, the_dict), default=0), 50)
+    lines = [""]
+    if header:
+        lines.append(header)
+    lines.append(line)
+    _format_dict(the_dict, 0, lines)
+    lines.append(line)
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+@functools.lru_cache(maxsize=32)
+def _load_parameters(fname: str, mtime_ns: int, size: int) -> dict:
+    """Decode a parameter file, memoised on the file's modification time and
+    size so that a changed file is read again"""
+    with open(fname, "rb") as json_file:
+        data = json_file.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 class OutputChannel(int, enum.Enum):  # int needed to avoid custom json serialiser
@@ -91,17 +138,126 @@ class InputChannel(int, enum.Enum):
     Fast4 = 3
 
 
+# Lookup tables for converting numeric values and names to channels
+_OUTPUT_BY_VALUE = {channel.value: channel for channel in OutputChannel}
+_INPUT_BY_VALUE = {channel.value: channel for channel in InputChannel}
+_OUTPUT_BY_NAME = {channel.name.lower(): channel for channel in OutputChannel}
+_INPUT_BY_NAME = {channel.name.lower(): channel for channel in InputChannel}
+_CHANNEL_TABLES = {
+    OutputChannel: (_OUTPUT_BY_VALUE, _OUTPUT_BY_NAME),
+    InputChannel: (_INPUT_BY_VALUE, _INPUT_BY_NAME),
+}
+
+
+def _coerce_channel(val: Any, channel_cls: type) -> Any:
+    """Resolve a channel, its numeric value or its name (in any case) to a
+    member of ``channel_cls``, returns ``None`` if there is no such channel"""
+    if isinstance(val, channel_cls):
+        return val
+    by_value, by_name = _CHANNEL_TABLES[channel_cls]
+    if isinstance(val, str):
+        return by_name.get(val.lower())
+    if isinstance(val, int) and not isinstance(val, bool):
+        return by_value.get(val)
+    return None
+
+
 # Dicts for converting between bools and text
 _ON_OFF = {True: "on", False: "off"}
 _ENABLED_DISABLED = {True: "enabled", False: "disabled"}
 
 
+def _checked_float(
+    val: Any, parameter_name: str, permitted_range: Tuple[float, float]
+) -> float:
+    """Cast ``val`` to float and check it against the ``(min, max)`` range
+
+    Raises
+    ------
+    OutOfRangeError
+        If the value is outside the range
+    """
+    val = float(val)
+    low, high = permitted_range
+    if not low <= val <= high:
+        raise OutOfRangeError(val, parameter_name, permitted_range)
+    return val
+
+
+def _check_scan_window(
+    offset: float, amplitude: float, scan_range: Tuple[float, float]
+):
+    """Check that a scan with the given offset and amplitude stays within
+    ``scan_range``
+
+    Raises
+    ------
+    OutOfRangeError
+        If either end of the scan is outside the range
+    """
+    half = abs(amplitude) / 2
+    low, high = offset - half, offset + half
+    if low < scan_range[0] or high > scan_range[1]:
+        raise OutOfRangeError([low, high], "scan", scan_range)
+
+
+def _same_value(old: Any, new: Any) -> bool:
+    """Whether a value to write equals the last one written, floats are
+    compared with ``math.isclose()``"""
+    if isinstance(old, float) and isinstance(new, float):
+        return math.isclose(old, new)
+    return old == new
+
+
+def _decop_type(param: Any) -> type:
+    """The Python type of the value of an SDK parameter object
+
+    Raises
+    ------
+    TypeError
+        If the parameter is not of one of the SDK parameter classes in
+        ``_DECOP_TYPES``
+    """
+    try:
+        return _DECOP_TYPES[type(param)]
+    except KeyError:
+        raise TypeError(
+            f"Unknown SDK parameter class '{type(param).__name__}'"
+        ) from None
+
+
+def _sdk_client(dlc: Any) -> Any:
+    """The client a ``DLCpro`` object opens and sends its requests through
+
+    The SDK keeps it in a private attribute and does not expose it otherwise,
+    so this is the only place accessing it"""
+    return dlc._DLCpro__client
+
+
+def _session_alive(connection: Any, dlc: Any) -> bool:
+    """Whether the network session of an opened ``DLCpro`` object can still be
+    used, that is, the device has not closed the command line (as it does when
+    it is restarted or the network drops)"""
+    if not _sdk_client(dlc).is_open or not connection.command_line_available:
+        return False
+    return not connection._command_line_reader.at_eof()
+
+
+def _close_session(dlc: Any):
+    """Close the session of a ``DLCpro`` object, also if the device has
+    already closed its end"""
+    try:
+        dlc.close()
+    except (OSError, decop.DecopError):
+        pass
+
+
 class DLCcontrol:
     """Control a Toptica DLCpro over an Ethernet connection
 
     Parameters
     ----------
-    ip : str, default is the class attribute _ip (which defaults to the module constant ``IP``)
+    ip : str, default is the module constant ``IP``
         IP address of the DLC unit
     open_on_init : bool, default ``True``
         Decide if ``open()`` should be called during the initialisation of
@@ -113,27 +269,71 @@ class DLCcontrol:
         Force the object to assume the wavelength of the laser can be set
     force_temp_control_available : bool, default ``False``
         Force the object to assume the temperature of the laser diode can be set
+    use_subscriptions : bool, default ``False``
+        Subscribe to updates of the emission, current, scan and
+        wavelength/temperature parameters when opening the connection, so that
+        reading these properties does not require a request to the DLC
+    cache_ttl : float, default 0
+        Seconds a value read with a property getter is reused for before it is
+        read from the DLC again. Writing any setting clears these values. The
+        default 0 reads the DLC on every access
+    keep_open : bool, default ``False``
+        Keep the network session open when the connection is closed, so that
+        the next ``DLCcontrol`` for the same IP can reuse it instead of
+        connecting again, see ``shutdown_pool()``
+    force_write : bool, default ``False``
+        Send every value given to a property setter to the DLC. By default, a
+        value equal to the last one written to the same setting is skipped,
+        unless the setting was read from the DLC since then
     """
 
-    _ip = IP
-    _service_psw = "look in datasheet"
-    """Custom SERVICE user level password unique to the DLCpro"""
-    _is_open = False
-    _remote_parameters = None
-    _scan_parameters = None
-    _lims = None
-    calibration = None
-    """MHz/mA or MHz/V calibration for the internal scan. Set by calling the
-    ``freq_per_sec_internal_scan()`` method. After being set, the calibration
-    will be kept in memory for future calls"""
-    wl_control_available = False
-    """Tells the object whether the laser is controlled with a wavelength setpoint"""
-    temp_control_available = False
-    """Tells the object whether the laser is controlled with a temperature setpoint"""
-    client = None
-    """After opening the connection the client can be used to control any setting
-    for the DLCpro, for instance `self.client.set("laser1:dl:cc:current-act", 10)`
-    to set the laser diode current to 10mA"""
+    __slots__ = (
+        "_ip",
+        "_service_psw",
+        "_is_open",
+        "_remote_parameters",
+        "_scan_parameters",
+        "_lims",
+        "_frange",
+        "_vrange",
+        "_crange",
+        "_trange",
+        "_wlrange",
+        "_scan_range",
+        "_remote_str",
+        "_remote_unit",
+        "_remote_units",
+        "_scan",
+        "_ctl",
+        "_dl",
+        "_cache",
+        "_read_cache",
+        "_subscriptions",
+        "_last_set",
+        "_pending_writes",
+        "_all_parameters",
+        "_last_refresh",
+        "calibration",
+        "wl_control_available",
+        "temp_control_available",
+        "discover_wl_or_temp_control",
+        "use_subscriptions",
+        "cache_ttl",
+        "force_write",
+        "keep_open",
+        "connection",
+        "client",
+        "dlc",
+        "_released",
+        "_poolable",
+    )
+
+    _connection_pool = {}
+    """SDK objects (connection, client and ``DLCpro``) of connections closed
+    with ``keep_open``, keyed by IP, handed to the next ``DLCcontrol`` for the
+    same IP instead of building new ones. The network session is kept open, so
+    the next ``DLCcontrol`` does not have to connect again, until
+    ``shutdown_pool()``"""
 
     def __init__(
         self,
@@ -142,22 +342,78 @@ class DLCcontrol:
         discover_wl_or_temp_control: bool = True,
         force_wl_control_available: bool = False,
         force_temp_control_available: bool = False,
+        use_subscriptions: bool = False,
+        cache_ttl: float = 0,
+        force_write: bool = False,
+        keep_open: bool = False,
     ):
-        self.discover_wl_or_temp_control = discover_wl_or_temp_control
-        if force_wl_control_available:
-            self.wl_control_available = True
-            self.discover_wl_or_temp_control = False
-        if force_temp_control_available:
-            self.temp_control_available = True
-            self.discover_wl_or_temp_control = False
-        if ip is not None:
-            self._ip = ip
-        self.connection = dlcsdk.NetworkConnection(self._ip)
-        self.client = client.Client(self.connection)
-        self.dlc = dlcsdk.DLCpro(self.connection)
+        _import_sdk()
+        self._ip = IP if ip is None else ip
+        self._service_psw = "look in datasheet"
+        """Custom SERVICE user level password unique to the DLCpro"""
+        self._is_open = False
+        self._remote_parameters = None
+        self._scan_parameters = None
+        self._lims = None
+        self._frange = self._vrange = self._crange = (None, None)
+        self._trange = self._wlrange = (None, None)
+        self._scan_range = None
+        self._remote_str = None
+        self._remote_unit = None
+        self._cache = {}
+        self._read_cache = {}
+        self._subscriptions = []
+        self._last_set = {}
+        self._pending_writes = None
+        self._all_parameters = None
+        self._last_refresh = 0.0
+        self.calibration = None
+        """MHz/mA or MHz/V calibration for the internal scan. Set by calling the
+        ``freq_per_sec_internal_scan()`` method. After being set, the calibration
+        will be kept in memory for future calls"""
+        self.wl_control_available = force_wl_control_available
+        """Tells the object whether the laser is controlled with a wavelength setpoint"""
+        self.temp_control_available = force_temp_control_available
+        """Tells the object whether the laser is controlled with a temperature setpoint"""
+        self.discover_wl_or_temp_control = discover_wl_or_temp_control and not (
+            force_wl_control_available or force_temp_control_available
+        )
+        self.use_subscriptions = use_subscriptions
+        self.cache_ttl = cache_ttl
+        self.force_write = force_write
+        self.keep_open = keep_open
+        self.client = None
+        """After opening the connection the client can be used to control any setting
+        for the DLCpro, for instance `self.client.set("laser1:dl:cc:current-act", 10)`
+        to set the laser diode current to 10mA"""
+        self._take_sdk_objects()
         if open_on_init:
             self.open()
 
+    def _take_sdk_objects(self):
+        """Take the connection, client and ``DLCpro`` objects for the IP from
+        the pool, or build them if there are none to reuse"""
+        pooled = self._connection_pool.pop(self._ip, None)
+        if pooled is not None and not _session_alive(pooled[0], pooled[-1]):
+            _close_session(pooled[-1])
+            pooled = None
+        if pooled is not None:
+            self.connection, self.client, self.dlc = pooled
+        else:
+            self.connection = dlcsdk.NetworkConnection(self._ip)
+            self.client = client.Client(self.connection)
+            self.dlc = dlcsdk.DLCpro(self.connection)
+        self._released = False
+        self._poolable = True
+        # Shorthands for the SDK objects used most, to save the attribute lookups
+        self._scan = self.dlc.laser1.scan
+        self._ctl = self.dlc.laser1.ctl
+        self._dl = self.dlc.laser1.dl
+        self._remote_units = {
+            "cc": self._dl.cc.external_input,
+            "pc": self._dl.pc.external_input,
+        }
+
     def __enter__(self):
         return self
 
@@ -165,22 +421,231 @@ class DLCcontrol:
         self.close()
 
     def open(self):
-        """Open the connection to the laser and get all the parameters of the
-        laser required to use the class"""
-        self.dlc.open()
+        """Open the connection to the laser
+
+        The limits, scan settings and analogue remote settings the class keeps
+        track of are read from the laser the first time they are needed"""
+        if self._is_open:
+            if _session_alive(self.connection, self.dlc):
+                return
+            # The subscriptions ended with the session
+            self._subscriptions = []
+            self._cache = {}
+            self._is_open = False
+        elif self._released:
+            if self._connection_pool.get(self._ip, (None,))[-1] is self.dlc:
+                # Nobody has reused the objects released on close, take them back
+                del self._connection_pool[self._ip]
+                self._released = False
+            else:
+                self._take_sdk_objects()
+        if _sdk_client(self.dlc).is_open and not _session_alive(
+            self.connection, self.dlc
+        ):
+            # The device has closed the session, connect anew
+            _close_session(self.dlc)
+            self._take_sdk_objects()
+        # A pooled session is still open
+        if not _sdk_client(self.dlc).is_open:
+            self.dlc.open()
         self._is_open = True
-        # Make sure all class attributes are up to date
+        self._poolable = True
+        # Forget what was read on a previous connection
+        self._lims = None
+        self._forget_settings()
         if self.discover_wl_or_temp_control:
             self._discover_control()
-        self.get_limits_from_dlc()
-        self.get_scan_parameters()
-        self.get_remote_parameters()
-        self._update_scan_range_attribute()
+        self.remote_select = "pc"
+        if self.use_subscriptions:
+            self._subscribe()
 
     def close(self):
-        """Close the connection to the DLC"""
+        """Close the connection to the DLC
+
+        With ``keep_open``, the network session is handed to the connection
+        pool and kept open for the next ``DLCcontrol`` with the same IP, use
+        ``shutdown_pool()`` to close it. Sessions where the user level was
+        changed, or that the device has closed, are closed immediately instead"""
+        for subscription in self._subscriptions:
+            subscription.cancel()
+        self._subscriptions = []
+        self._cache = {}
+        self._read_cache = {}
         if self._is_open:
-            self.dlc.close()
+            self._is_open = False
+            if not (
+                self.keep_open
+                and self._poolable
+                and _session_alive(self.connection, self.dlc)
+            ):
+                _close_session(self.dlc)
+                return
+            pooled = self._connection_pool.pop(self._ip, None)
+            if pooled is not None:
+                # Only one session per IP is kept
+                _close_session(pooled[-1])
+            self._connection_pool[self._ip] = (self.connection, self.client, self.dlc)
+            self._released = True
+
+    @classmethod
+    def shutdown_pool(cls):
+        """Close the network sessions kept in the connection pool, so that the
+        next ``DLCcontrol`` connects anew"""
+        while cls._connection_pool:
+            _, (_, _, dlc) = cls._connection_pool.popitem()
+            _close_session(dlc)
+
+    def _subscribed_params(self) -> List[Any]:
+        """The SDK parameter objects that are kept up to date with subscriptions
+        when ``use_subscriptions`` is ``True``: the ones read by
+        ``get_all_parameters()`` (the scan parameters first) and the emission
+        status"""
+        params = self._scan_param_objects()
+        params += [
+            self.dlc.emission,
+            self.dlc.emission_button_enabled,
+            self._dl.cc.enabled,
+        ]
+        if self.wl_control_available:
+            params += [self._ctl.wavelength_set, self._ctl.wavelength_act]
+        if self.temp_control_available:
+            params += [self._dl.tc.temp_set, self._dl.tc.temp_act]
+        return params
+
+    def _subscribe(self):
+        """Subscribe to updates of the ``_subscribed_params()``, the DLC will
+        then push new values to ``_cache`` when they change"""
+        for param in self._subscribed_params():
+            self._subscriptions.append(param.subscribe(self._on_update))
+
+    def _on_update(self, subscription, timestamp, value):
+        """Subscription callback storing the new value in ``_cache``"""
+        # The value may differ from the one last written
+        self._last_set.pop(subscription.name, None)
+        try:
+            self._cache[subscription.name] = value.get()
+        except decop.DecopError:
+            self._cache.pop(subscription.name, None)
+
+    def _get_values(self, params: List[Any]) -> List[Any]:
+        """Get the values of several SDK parameter objects, from the
+        subscription cache where available and the rest from the DLC in one
+        request"""
+        if not self._subscriptions:
+            return self._batch_get(params)
+        # Invoke the callbacks for the updates received so far
+        _sdk_client(self.dlc).poll()
+        cache = self._cache
+        for param in params:
+            self._last_set.pop(param.name, None)
+        missing = [param for param in params if param.name not in cache]
+        read = iter(self._batch_get(missing))
+        return [
+            cache[param.name] if param.name in cache else next(read) for param in params
+        ]
+
+    def _check_open(self):
+        """Raise an error if the connection is closed, also when its session
+        is kept open in the pool (possibly used by another ``DLCcontrol``)"""
+        if not self._is_open or not _sdk_client(self.dlc).is_open:
+            raise client.UnavailableError(
+                "The client connection to the device is closed."
+            )
+
+    def _cached_get(self, param: Any) -> Any:
+        """Get the value of an SDK parameter object from the subscription cache,
+        or from the values read less than ``cache_ttl`` seconds ago, or else
+        from the DLC"""
+        self._check_open()
+        # The value read may differ from the one last written (if the setting
+        # was changed on the DLC), so do not skip writing it next time
+        self._last_set.pop(param.name, None)
+        if self._subscriptions:
+            # Invoke the callbacks for the updates received so far
+            param._client.poll()
+            try:
+                return self._cache[param.name]
+            except KeyError:
+                pass
+        if not self.cache_ttl:
+            return param.get()
+        now = time.monotonic()
+        try:
+            read_at, value = self._read_cache[param.name]
+            if now - read_at < self.cache_ttl:
+                return value
+        except KeyError:
+            pass
+        value = param.get()
+        self._read_cache[param.name] = (now, value)
+        return value
+
+    def _set(self, param: Any, val: Any, skip_unchanged: bool = False):
+        """Set the value of an SDK parameter object (or queue it within a
+        ``transaction()``) and drop cached values (all of the ``cache_ttl``
+        ones, as settings can depend on each other)
+
+        With ``skip_unchanged``, a value equal to the last one written to the
+        parameter is not sent again (unless ``force_write`` is set). Reading
+        the parameter forgets the last written value"""
+        self._check_open()
+        name = param.name
+        if (
+            skip_unchanged
+            and not self.force_write
+            and name in self._last_set
+            and _same_value(self._last_set[name], val)
+        ):
+            return
+        if self._pending_writes is None:
+            param.set(val)
+        else:
+            decop_type = _decop_type(param)
+            if not isinstance(val, decop_type):
+                raise TypeError(
+                    f"Expected type '{decop_type.__name__}' for '{param.name}', "
+                    f"got '{type(val).__name__}'"
+                )
+            self._pending_writes.append((param, val))
+        self._last_set[name] = val
+        self._cache.pop(name, None)
+        self._read_cache.clear()
+        self._all_parameters = None
+
+    def _set_float(
+        self,
+        param: Any,
+        val: Any,
+        permitted_range: Tuple[float, float],
+        parameter_name: str,
+        skip_unchanged: bool = False,
+    ) -> float:
+        """Cast ``val`` to float, check it against the ``(min, max)`` range and
+        set the SDK parameter object to it (see ``_set()``)
+
+        Raises
+        ------
+        OutOfRangeError
+            If the value is outside the range
+        """
+        val = _checked_float(val, parameter_name, permitted_range)
+        self._set(param, val, skip_unchanged)
+        return val
+
+    def refresh(self):
+        """Re-read the values the class keeps locally, for instance after
+        settings were changed on the DLC's front panel: the scan parameters
+        the scan setters check against and, with ``use_subscriptions``, the
+        subscribed parameters (all in one request). Values kept because of
+        ``cache_ttl`` are dropped"""
+        self._read_cache.clear()
+        self._last_set = {}
+        scan_params = self._scan_param_objects()
+        params = self._subscribed_params() if self._subscriptions else scan_params
+        values = self._batch_get(params)
+        self._store_scan_parameters(values[: len(scan_params)])
+        if self._subscriptions:
+            self._cache.update(zip((param.name for param in params), values))
 
     def set_user_level(
         self, level: int, password: str = "default", verbose: bool = True
@@ -211,20 +676,153 @@ class DLCcontrol:
                 password = MAINTENANCE_PSW
         ul = decop.UserLevel(level)
         result = self.dlc.change_ul(ul, password)
+        # Do not hand a session with changed privileges to other instances
+        self._poolable = False
         if verbose:
             print(f"New user level: {result.name}")
 
-    def get_user_level(self) -> decop.UserLevel:
+    def get_user_level(self) -> "decop.UserLevel":
         """Gets the user level privileges of the *connection*, does not reflect the
         user level on the DLCpro console"""
         return decop.UserLevel(self.client.get("ul"))
 
+    def _pipeline(self, commands: List[str]) -> List[str]:
+        """Write all ``commands`` to the command line back-to-back before
+        reading the replies in order, so that they share a single network round
+        trip"""
+        self._check_open()
+        sdk_client = _sdk_client(self.dlc)
+        connection = sdk_client.connection
+
+        async def pipeline():
+            await connection.write_command_line("".join(commands))
+            # Read all replies before decoding so the command line stays in
+            # sync even if one of the commands returned an error
+            return [await connection.read_command_line() for _ in commands]
+
+        return sdk_client._async_run(pipeline())
+
+    def _batch_get(self, params: List[Any]) -> List[Any]:
+        """Read several parameters in one pipelined request
+
+        Parameters
+        ----------
+        params : list
+            SDK parameter objects, for instance ``self.dlc.laser1.scan.enabled``,
+            or DeCoP parameter names, for instance ``"laser1:scan:enabled"``
+            (the type of the value is then inferred from the reply)
+
+        Returns
+        -------
+        list
+            The values of the parameters, in the same order as ``params``
+        """
+        if not params:
+            return []
+        names = [param if isinstance(param, str) else param.name for param in params]
+        for name in names:
+            self._last_set.pop(name, None)
+        replies = self._pipeline([f"(param-ref '{name})\n" for name in names])
+        return [
+            (
+                decop.decode_value_inferred(reply)
+                if isinstance(param, str)
+                else decop.decode_value(reply, _decop_type(param))
+            )
+            for reply, param in zip(replies, params)
+        ]
+
+    def _batch_set(self, params: List[Any], values: List[Any]):
+        """Set several parameters in one pipelined request (or queue them
+        within a ``transaction()``), the values are written in the order they
+        are given
+
+        Raises
+        ------
+        decop.DecopError
+            If the DLC refused any of the new values (the other values in the
+            batch are still written)
+        """
+        if not params:
+            return
+        for param in params:
+            self._cache.pop(param.name, None)
+            # Only known once the DLC accepted the value
+            self._last_set.pop(param.name, None)
+        self._read_cache.clear()
+        self._all_parameters = None
+        if self._pending_writes is not None:
+            self._pending_writes.extend(zip(params, values))
+            self._last_set.update(
+                (param.name, val) for param, val in zip(params, values)
+            )
+            return
+        replies = self._pipeline(
+            [
+                f"(param-set! '{param.name} {decop.encode_value(val)})\n"
+                for param, val in zip(params, values)
+            ]
+        )
+        for reply, param, val in zip(replies, params, values):
+            # Skip any additional output before the status code
+            status = decop.decode_value(reply.splitlines()[-1], int)
+            if status < 0:
+                raise decop.DecopError(
+                    f"Setting parameter '{param.name}' to '{val}' failed: '{status}'"
+                )
+            self._last_set[param.name] = val
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """Context manager collecting the values written with the property
+        setters, ``set_scan()`` and ``set_parameters()`` within the block, and
+        writing them to the DLC in one request at the end of the block
+
+        The values are checked when they are set, as usual, but reading a
+        property within the block gives the value on the DLC, without the
+        queued changes. If the block raises an exception, none of the queued
+        values are written
+
+        Example
+        -------
+
+            with DLCcontrol(ip) as dlc:
+                with dlc.transaction():
+                    dlc.remote_select = "CC"
+                    dlc.remote_signal = "Fine1"
+                    dlc.remote_factor = 10
+                    dlc.remote_enabled = True
+
+        Raises
+        ------
+        decop.DecopError
+            If the DLC refused any of the new values (the other values are
+            still written)
+        """
+        if self._pending_writes is not None:
+            # Within an enclosing transaction, which does the writing
+            yield
+            return
+        pending = self._pending_writes = []
+        written = False
+        try:
+            yield
+            self._pending_writes = None
+            self._batch_set([param for param, _ in pending], [v for _, v in pending])
+            written = True
+        finally:
+            self._pending_writes = None
+            if not written:
+                # The setters have updated the local copies of the settings
+                # already, so they no longer match the DLC
+                self._forget_settings()
+
     # Limits and settings ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ ##
 
     def _discover_control(self, verbose: bool = False):
         # Check for wavelength control
         try:
-            self.dlc.laser1.ctl.wavelength_min.get()
+            self._ctl.wavelength_min.get()
             self.wl_control_available = True
         except decop.DecopError as e:
             errormsg = e.args[0]
@@ -235,7 +833,7 @@ class DLCcontrol:
             self.temp_control_available = False
         # Check for laser diode temperature control
         try:
-            self.dlc.laser1.dl.tc.temp_set_min.get()
+            self._dl.tc.temp_set_min.get()
             self.temp_control_available = True
         except decop.DecopError as e:
             errormsg = e.args[0]
@@ -252,18 +850,26 @@ class DLCcontrol:
 
     def get_limits_from_dlc(self, verbose: bool = False) -> dict:
         """Query the laser for the wavelength, piezo voltage, current and
-        scan frequency limits, and populate the ``_lims`` dict attribute
+        scan frequency limits (in one request), and populate the ``_lims`` dict
+        attribute
 
         Returns
         -------
         self._lims : dict
             The limits
         """
+        dl = self._dl
+        params = [dl.pc.voltage_min, dl.pc.voltage_max, dl.cc.current_clip]
+        if self.wl_control_available:
+            params += [self._ctl.wavelength_min, self._ctl.wavelength_max]
+        if self.temp_control_available:
+            params += [dl.tc.temp_set_min, dl.tc.temp_set_max]
+        values = iter(self._batch_get(params))
         self._lims = {
-            "vmin": self.dlc.laser1.dl.pc.voltage_min.get(),
-            "vmax": self.dlc.laser1.dl.pc.voltage_max.get(),
+            "vmin": next(values),
+            "vmax": next(values),
             "cmin": 0.0,
-            "cmax": self.dlc.laser1.dl.cc.current_clip.get(),
+            "cmax": next(values),
             "fmin": 0.02,
             "fmax": 400,  # cannot find max in manual
             "tmin": None,
@@ -272,19 +878,10 @@ class DLCcontrol:
             "wlmax": None,
         }
         if self.wl_control_available:
-            self._lims.update(
-                {
-                    "wlmin": self.dlc.laser1.ctl.wavelength_min.get(),
-                    "wlmax": self.dlc.laser1.ctl.wavelength_max.get(),
-                }
-            )
+            self._lims["wlmin"], self._lims["wlmax"] = next(values), next(values)
         if self.temp_control_available:
-            self._lims.update(
-                {
-                    "tmin": self.dlc.laser1.dl.tc.temp_set_min.get(),
-                    "tmax": self.dlc.laser1.dl.tc.temp_set_max.get(),
-                }
-            )
+            self._lims["tmin"], self._lims["tmax"] = next(values), next(values)
+        self._define_internal_shorthands()
         if verbose:
             _print_dict(self._lims)
         return self._lims
@@ -298,44 +895,75 @@ class DLCcontrol:
         self._scan_parameters : dict
             All parameters for the internal scan
         """
-        self._scan_parameters = {
-            "enabled": self.scan_enabled,
-            "output channel": self.scan_output_channel,
-            "frequency": self.scan_frequency,
-            "amplitude": self.scan_amplitude,
-            "offset": self.scan_offset,
-            "start": self.scan_start,
-            "end": self.scan_end,
-        }
+        self._store_scan_parameters(self._batch_get(self._scan_param_objects()))
         if verbose:
             _print_dict(self._scan_parameters)
         return self._scan_parameters
 
-    @property
-    def _vrange(self):
-        return self._lims["vmin"], self._lims["vmax"]
-
-    @property
-    def _crange(self):
-        return self._lims["cmin"], self._lims["cmax"]
-
-    @property
-    def _trange(self):
-        return self._lims["tmin"], self._lims["tmax"]
+    def _scan_param_objects(self) -> List[Any]:
+        """The SDK parameter objects read by ``get_scan_parameters()``"""
+        scan = self._scan
+        return [
+            scan.enabled,
+            scan.output_channel,
+            scan.frequency,
+            scan.amplitude,
+            scan.offset,
+            scan.start,
+            scan.end,
+        ]
+
+    def _store_scan_parameters(self, values: List[Any]):
+        """Populate ``_scan_parameters`` from the values of the
+        ``_scan_param_objects()``"""
+        enabled, channel, frequency, amplitude, offset, start, end = values
+        previous = self._scan_parameters
+        self._scan_parameters = {
+            "enabled": enabled,
+            "output channel": _OUTPUT_BY_VALUE[channel],
+            "frequency": frequency,
+            "amplitude": amplitude,
+            "offset": offset,
+            "start": start,
+            "end": end,
+        }
+        if self._lims is not None and (
+            previous is None or previous["output channel"] != channel
+        ):
+            self._update_scan_range_attribute()
+
+    def _define_internal_shorthands(self):
+        """Store the ranges from ``_lims`` as tuples so that the setters do not
+        need to look them up for every check"""
+        self._frange = self._lims["fmin"], self._lims["fmax"]
+        self._vrange = self._lims["vmin"], self._lims["vmax"]
+        self._crange = self._lims["cmin"], self._lims["cmax"]
+        self._trange = self._lims["tmin"], self._lims["tmax"]
+        self._wlrange = self._lims["wlmin"], self._lims["wlmax"]
+        if self._scan_parameters is not None:
+            self._update_scan_range_attribute()
+
+    def _load_scan_state(self):
+        """Read the limits and the scan settings from the DLC if they have not
+        been read since the connection was opened"""
+        if self._lims is None:
+            self.get_limits_from_dlc()
+        if self._scan_parameters is None:
+            self.get_scan_parameters()
 
-    @property
-    def _wlrange(self):
-        return self._lims["wlmin"], self._lims["wlmax"]
+    def _range_for_channel(self, channel: OutputChannel) -> Tuple[float, float]:
+        """The permitted scan range when scanning on ``channel``"""
+        if channel == OutputChannel.CC:
+            return self._crange
+        if channel == OutputChannel.PC:
+            return self._vrange
+        return (-math.inf, math.inf)
 
     def _update_scan_range_attribute(self, channel: Union[None, OutputChannel] = None):
         if channel is None:
             channel = self._scan_parameters["output channel"]
-        if channel == OutputChannel.CC:
-            self._scan_range = self._crange
-        elif channel == OutputChannel.PC:
-            self._scan_range = self._vrange
-        else:
-            self._scan_range = [-np.inf, np.inf]
+        self._scan_range = self._range_for_channel(channel)
+        if channel not in (OutputChannel.CC, OutputChannel.PC):
             print("(!) Warning: Scan range for OutA and OutB is not limted", flush=True)
 
     def get_remote_parameters(self, verbose: bool = False) -> dict:
@@ -347,78 +975,256 @@ class DLCcontrol:
         self._scan_parameters : dict
             All parameters for the analogue remote control
         """
+        values = self._batch_get(
+            [
+                param
+                for unit in self._remote_units.values()
+                for param in (unit.enabled, unit.factor, unit.signal)
+            ]
+        )
         self._remote_parameters = {}
-        for unit in ("cc", "pc"):
-            self.remote_select = unit
+        for i, unit in enumerate(self._remote_units):
+            enabled, factor, signal = values[3 * i : 3 * i + 3]
             self._remote_parameters[unit] = {
-                "enabled": self.remote_enabled,
-                "factor": self.remote_factor,
-                "signal": self.remote_signal,
+                "enabled": enabled,
+                "factor": factor,
+                "signal": _INPUT_BY_VALUE[signal],
             }
         if verbose:
             _print_dict(self._remote_parameters)
         return self._remote_parameters
 
-    def get_all_parameters(self, verbose: bool = False) -> dict:
+    def get_all_parameters(self, verbose: bool = False, max_age: float = 0) -> dict:
         """Returns an updated dictionary of all the parameters that can be set
         with the module
 
+        Parameters
+        ----------
+        verbose : bool, default ``False``
+            Print the parameters
+        max_age : float, default 0
+            Return the previously read parameters instead of querying the DLC
+            if they are less than ``max_age`` seconds old (writing any setting
+            with the class drops them, changes made on the DLC in the meantime
+            are not reflected)
+
+        With ``use_subscriptions``, the values the DLC has pushed are used and
+        only the others are read
+
         Returns
         -------
         dict
             A nested dictionary with the parameters
         """
+        if (
+            self._all_parameters is not None
+            and time.monotonic() - self._last_refresh < max_age
+        ):
+            if verbose:
+                _print_dict(self._all_parameters)
+            return self._all_parameters
         timestamp = datetime.datetime.now()
-        wls = {
-            "wl setpoint": self.wavelength_setpoint,
-            "wl actual": self.wavelength_actual,
-        }
-        temps = {"temp setpoint": self.temp_setpoint, "temp actual": self.temp_actual}
-        # Updating scan parameters as they are interdependent
+        # Read the scan parameters (they are interdependent, so all are updated)
+        # and the available wavelength/temperature values in one request (or
+        # none, if they are all subscribed)
+        params_to_read = self._scan_param_objects()
+        n_scan = len(params_to_read)
+        if self.wl_control_available:
+            ctl = self._ctl
+            params_to_read += [ctl.wavelength_set, ctl.wavelength_act]
+        if self.temp_control_available:
+            tc = self._dl.tc
+            params_to_read += [tc.temp_set, tc.temp_act]
+        values = self._get_values(params_to_read)
+        self._store_scan_parameters(values[:n_scan])
+        extra = iter(values[n_scan:])
+        wls = {"wl setpoint": None, "wl actual": None}
+        if self.wl_control_available:
+            wls["wl setpoint"], wls["wl actual"] = next(extra), next(extra)
+        temps = {"temp setpoint": None, "temp actual": None}
+        if self.temp_control_available:
+            temps["temp setpoint"], temps["temp actual"] = next(extra), next(extra)
         params = {
             "timestamp": str(timestamp),
-            "scan": self.get_scan_parameters(),
-            "analogue remote": self._remote_parameters,
+            "scan": self._scan_parameters,
+            "analogue remote": self._remote_parameters or self.get_remote_parameters(),
             "wavelength": wls,
             "temperature": temps,
         }
+        self._all_parameters = params
+        self._last_refresh = time.monotonic()
         if verbose:
             _print_dict(params)
         return params
 
-    def save_parameters(self, fname: str):
+    def save_parameters(self, fname: str, params: Union[dict, None] = None):
         """Grab an updated set of laser parameters and save to a ``json`` file
 
+        Parameters
+        ----------
+        fname : str
+            Filename, ``.json`` is appended if missing
+        params : dict, optional
+            Parameters as returned by ``get_all_parameters()``, if they have
+            already been read. If not given, the parameters are read from the DLC
+
         Raises
         ------
         RuntimeError
             If a file with name `fname` already exists
         """
-        params = self.get_all_parameters()
+        if params is None:
+            params = self.get_all_parameters()
         if not fname.endswith(".json"):
             fname += ".json"
-        if os.path.exists(fname):
-            raise RuntimeError(f"File '{fname}' already exists")
-        with open(fname, "w") as outfile:
-            json.dump(params, outfile, indent="  ")
+        if orjson is not None:
+            data = orjson.dumps(params, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(params, indent="  ").encode()
+        # Create the file exclusively so an existing file is never overwritten,
+        # also if it appears after the parameters were read
+        try:
+            fd = os.open(fname, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        except FileExistsError:
+            raise RuntimeError(f"File '{fname}' already exists") from None
+        with os.fdopen(fd, "wb") as outfile:
+            outfile.write(data)
 
     @staticmethod
     def read_parameters(fname: str, verbose: bool = True) -> dict:
-        """Read (but not set!) parameters from json file"""
+        """Read (but not set!) parameters from json file
+
+        Repeated reads of an unchanged file are served from memory, the returned
+        dictionary is a copy that can be modified freely"""
         if not fname.endswith(".json"):
             fname += ".json"
-        with open(fname) as json_file:
-            params = json.load(json_file)
+        stat = os.stat(fname)
+        params = copy.deepcopy(_load_parameters(fname, stat.st_mtime_ns, stat.st_size))
         if verbose:
             _print_dict(params)
         return params
 
     def set_parameters(self, params: dict):
-        """*Not yet implemented*
+        """Set the laser according to a parameter dictionary, as returned by
+        ``get_all_parameters()`` or ``read_parameters()``
 
-        The idea is to be able to use the parameters in a dict and set them
-        accordingly"""
-        raise NotImplementedError("Still to be implemented")
+        All the values are checked before any of them is written, and they are
+        then written in one request. Sections and entries missing from
+        ``params`` are left unchanged. The timestamp, the actual wavelength and
+        temperature, and the scan start and end (which follow from the offset
+        and amplitude) are not written
+
+        Parameters
+        ----------
+        params : dict
+            A nested dictionary of parameters
+
+        Raises
+        ------
+        OutOfRangeError
+            If a value is outside its permitted range
+        ValueError
+            If a channel or remote unit is not recognised
+        RuntimeError
+            If a wavelength or temperature setpoint is given for a laser that
+            does not have this option
+        decop.DecopError
+            If the DLC refused any of the new values
+        """
+        self._load_scan_state()
+        to_set, values = [], []
+        # Scan, with the output channel set first as it decides the scan range
+        scan = self._scan
+        scan_params = params.get("scan", {})
+        channel = self._scan_parameters["output channel"]
+        if "output channel" in scan_params:
+            channel = _coerce_channel(scan_params["output channel"], OutputChannel)
+            if channel is None:
+                raise ValueError(
+                    f"Unknown scan output channel '{scan_params['output channel']}'"
+                )
+            to_set.append(scan.output_channel)
+            values.append(channel.value)
+        if "frequency" in scan_params:
+            frequency = _checked_float(
+                scan_params["frequency"], "scan frequency", self._frange
+            )
+            to_set.append(scan.frequency)
+            values.append(frequency)
+        offset = float(scan_params.get("offset", self._scan_parameters["offset"]))
+        amplitude = float(
+            scan_params.get("amplitude", self._scan_parameters["amplitude"])
+        )
+        scan_range = self._range_for_channel(channel)
+        _check_scan_window(offset, amplitude, scan_range)
+        for param, val in self._scan_window_writes(
+            offset if "offset" in scan_params else None,
+            amplitude if "amplitude" in scan_params else None,
+        ):
+            to_set.append(param)
+            values.append(val)
+        # Analogue remote
+        for unit, settings in params.get("analogue remote", {}).items():
+            try:
+                remote_unit = self._remote_units[unit]
+            except KeyError:
+                raise ValueError(f"Unknown remote unit '{unit}'") from None
+            if "signal" in settings:
+                signal = _coerce_channel(settings["signal"], InputChannel)
+                if signal is None:
+                    raise ValueError(f"Unknown input channel '{settings['signal']}'")
+                to_set.append(remote_unit.signal)
+                values.append(signal.value)
+            if "factor" in settings:
+                to_set.append(remote_unit.factor)
+                values.append(float(settings["factor"]))
+            if "enabled" in settings:
+                to_set.append(remote_unit.enabled)
+                values.append(bool(settings["enabled"]))
+        # Wavelength or temperature setpoint
+        setpoints = (
+            (
+                params.get("wavelength", {}).get("wl setpoint"),
+                "wavelength setpoint",
+                self.wl_control_available,
+                self._ctl.wavelength_set,
+                self._wlrange,
+            ),
+            (
+                params.get("temperature", {}).get("temp setpoint"),
+                "temperature setpoint",
+                self.temp_control_available,
+                self._dl.tc.temp_set,
+                self._trange,
+            ),
+        )
+        for val, name, available, param, permitted_range in setpoints:
+            if val is None:
+                continue
+            if not available:
+                raise RuntimeError(f"The laser does not have a {name}")
+            to_set.append(param)
+            values.append(_checked_float(val, name, permitted_range))
+        # Turn the scan on or off once it is set up
+        if "enabled" in scan_params:
+            to_set.append(scan.enabled)
+            values.append(bool(scan_params["enabled"]))
+        try:
+            self._batch_set(to_set, values)
+        finally:
+            # Read the stored values again when they are next needed
+            for param in to_set:
+                self._cache.pop(param.name, None)
+            self._forget_settings()
+
+    def _forget_settings(self):
+        """Drop the local copies of the settings, so that they are read from
+        the DLC when they are next needed"""
+        self._last_set = {}
+        self._scan_parameters = None
+        self._remote_parameters = None
+        self._all_parameters = None
+        self._last_refresh = 0.0
 
     def verbose_emission_status(self):
         """Print the emission status of the laser, for example
@@ -428,9 +1234,25 @@ class DLCcontrol:
         Therefore, emission is ON
         ```
         """
-        print(f"Emission button is {_ENABLED_DISABLED[self.emission_button]}")
-        print(f"Laser current is {_ENABLED_DISABLED[self.current_enabled]}")
-        print(f"Therefore, emission is {_ON_OFF[self.emission]}")
+        if self._subscriptions:
+            button, current, emission = (
+                self.emission_button,
+                self.current_enabled,
+                self.emission,
+            )
+        else:
+            button, current, emission = self._batch_get(
+                [
+                    self.dlc.emission_button_enabled,
+                    self._dl.cc.enabled,
+                    self.dlc.emission,
+                ]
+            )
+        print(
+            f"Emission button is {_ENABLED_DISABLED[button]}\n"
+            f"Laser current is {_ENABLED_DISABLED[current]}\n"
+            f"Therefore, emission is {_ON_OFF[emission]}"
+        )
 
     def freq_per_sec_internal_scan(self, calibration: float = None) -> float:
         """Calculate frequency span per second for the laser in MHz per second
@@ -455,17 +1277,17 @@ class DLCcontrol:
     @property
     def emission(self) -> bool:
         """Emission status of the DLC (read only)"""
-        return self.dlc.emission.get()
+        return self._cached_get(self.dlc.emission)
 
     @property
     def emission_button(self) -> bool:
         """Status of the emission button of the DLC (read only)"""
-        return self.dlc.emission_button_enabled.get()
+        return self._cached_get(self.dlc.emission_button_enabled)
 
     @property
     def current_enabled(self) -> bool:
         """Status of the current to the laser"""
-        return self.dlc.laser1.dl.cc.enabled.get()
+        return self._cached_get(self._dl.cc.enabled)
 
     @current_enabled.setter
     def current_enabled(self, val: bool):
@@ -473,7 +1295,7 @@ class DLCcontrol:
         DLC is enabled"""
         if val and not self.emission_button:
             print("(!) Emission button on DLC not enabled, so cannot enable emission")
-        self.dlc.laser1.dl.cc.enabled.set(val)
+        self._set(self._dl.cc.enabled, val)
 
     # Wavelength properties ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ ##
 
@@ -482,14 +1304,14 @@ class DLCcontrol:
         """The actual wavelength of the laser (read only)"""
         if not self.wl_control_available:
             return None
-        return self.dlc.laser1.ctl.wavelength_act.get()
+        return self._cached_get(self._ctl.wavelength_act)
 
     @property
     def wavelength_setpoint(self) -> float:
         """The setpont of the laser wavelength"""
         if not self.wl_control_available:
             return None
-        return self.dlc.laser1.ctl.wavelength_set.get()
+        return self._cached_get(self._ctl.wavelength_set)
 
     @wavelength_setpoint.setter
     def wavelength_setpoint(self, val: float):
@@ -499,11 +1321,15 @@ class DLCcontrol:
             )
         if val is None:
             return
-        val = float(val)
         if self._wlrange[0] is None:
             self.get_limits_from_dlc()
-        _check_value(val, "wavelength setpoint", self._wlrange)
-        self.dlc.laser1.ctl.wavelength_set.set(val)
+        self._set_float(
+            self._ctl.wavelength_set,
+            val,
+            self._wlrange,
+            "wavelength setpoint",
+            skip_unchanged=True,
+        )
 
     ## Temperature properties ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ ##
 
@@ -512,14 +1338,14 @@ class DLCcontrol:
         """The actual temperature of the laser diode (read only)"""
         if not self.temp_control_available:
             return None
-        return self.dlc.laser1.dl.tc.temp_act.get()
+        return self._cached_get(self._dl.tc.temp_act)
 
     @property
     def temp_setpoint(self) -> float:
         """The setpoint of the laser diode temperature"""
         if not self.temp_control_available:
             return None
-        return self.dlc.laser1.dl.tc.temp_set.get()
+        return self._cached_get(self._dl.tc.temp_set)
 
     @temp_setpoint.setter
     def temp_setpoint(self, val: float):
@@ -529,11 +1355,15 @@ class DLCcontrol:
             )
         if val is None:
             return
-        val = float(val)
         if self._trange[0] is None:
             self.get_limits_from_dlc()
-        _check_value(val, "temperature setpoint", self._trange)
-        self.dlc.laser1.dl.tc.temp_set.set(val)
+        self._set_float(
+            self._dl.tc.temp_set,
+            val,
+            self._trange,
+            "temperature setpoint",
+            skip_unchanged=True,
+        )
 
     # Remote properties ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ ##
 
@@ -553,12 +1383,12 @@ class DLCcontrol:
                 # Decide its input..
                 dlc.remote_signal = "Fine1"
                 # ..and enable it
-                dlc.remote_enable = True
+                dlc.remote_enabled = True
                 # Now move to the ARC for the piezo..
                 dlc.remote_select = "PC"
                 # ..and choose some settings for it
                 dlc.remote_signal = "Fast3"
-                dlc.remote_enable = True
+                dlc.remote_enabled = True
 
         """
         return self._remote_str, self._remote_unit
@@ -568,171 +1398,388 @@ class DLCcontrol:
         """
         select : {"pc", "cc"}
         """
-        if select.lower() == "cc":
-            self._remote_str = "cc"
-            self._remote_unit = self.dlc.laser1.dl.cc.external_input
-        elif select.lower() == "pc":
-            self._remote_str = "pc"
-            self._remote_unit = self.dlc.laser1.dl.pc.external_input
-        else:
+        unit = select.lower()
+        try:
+            self._remote_unit = self._remote_units[unit]
+        except KeyError:
             raise ValueError(
-                f"select must be either 'pc' nor 'cc' (tried using '{select}')"
-            )
+                f"select must be either 'pc' or 'cc' (tried using '{select}')"
+            ) from None
+        self._remote_str = unit
 
     @property
     def remote_enabled(self) -> bool:
         """Status of the chosen remote"""
-        return self._remote_unit.enabled.get()
+        return self._cached_get(self._remote_unit.enabled)
 
     @remote_enabled.setter
     def remote_enabled(self, val: bool):
-        self._remote_unit.enabled.set(val)
-        self._remote_parameters[self._remote_str]["enabled"] = val
+        self._set(self._remote_unit.enabled, val, skip_unchanged=True)
+        if self._remote_parameters is not None:
+            self._remote_parameters[self._remote_str]["enabled"] = val
 
     @property
     def remote_signal(self) -> InputChannel:
         """The input port the chosen remote uses"""
-        num = self._remote_unit.signal.get()
-        return InputChannel(num)
+        num = self._cached_get(self._remote_unit.signal)
+        return _INPUT_BY_VALUE[num]
 
     @remote_signal.setter
-    def remote_signal(self, val: Union[InputChannel, str]):
+    def remote_signal(self, val: Union[InputChannel, str, int]):
         """Choose which output channel to use for the ARC
         val : {"Fine1", "Fine2", "Fast3", "Fast4",
                InputChannel.Fine1, InputChannel.Fine2,
-               InputChannel.Fast3, InputChannel.Fast4}"""
-        try:
-            if isinstance(val, InputChannel):
-                num = val.value
-            elif isinstance(val, str):
-                num = InputChannel[val.title()].value
-            else:
-                raise KeyError
-        except KeyError:
+               InputChannel.Fast3, InputChannel.Fast4}
+              or the numeric value of the channel"""
+        channel = _coerce_channel(val, InputChannel)
+        if channel is None:
             raise ValueError(
-                "Input channel must be one of 'Fine1', 'Fine2', "
-                f"'Fast3', 'Fast4', or an InputChannel (tried with '{val}')"
-            ) from KeyError
-        self._remote_unit.signal.set(num)
-        self._remote_parameters[self._remote_str]["signal"] = InputChannel(num)
+                "Input channel must be one of 'Fine1', 'Fine2', 'Fast3', "
+                f"'Fast4', or an InputChannel or its value (tried with '{val}')"
+            )
+        self._set(self._remote_unit.signal, channel.value, skip_unchanged=True)
+        if self._remote_parameters is not None:
+            self._remote_parameters[self._remote_str]["signal"] = channel
 
     @property
     def remote_factor(self) -> float:
         """The numerical factor the remote signal is multiplied with before used
         as the current or piezo control"""
-        return self._remote_unit.factor.get()
+        return self._cached_get(self._remote_unit.factor)
 
     @remote_factor.setter
     def remote_factor(self, val: float):
         val = float(val)
-        self._remote_unit.factor.set(val)
-        self._remote_parameters[self._remote_str]["factor"] = val
+        self._set(self._remote_unit.factor, val, skip_unchanged=True)
+        if self._remote_parameters is not None:
+            self._remote_parameters[self._remote_str]["factor"] = val
 
     # Scan properties ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ ##
 
     @property
     def scan_enabled(self) -> bool:
         """Internal scan on/off"""
-        return self.dlc.laser1.scan.enabled.get()
+        return self._cached_get(self._scan.enabled)
 
     @scan_enabled.setter
     def scan_enabled(self, val: bool):
-        self.dlc.laser1.scan.enabled.set(val)
-        self._scan_parameters["enabled"] = val
+        self._set(self._scan.enabled, val, skip_unchanged=True)
+        if self._scan_parameters is not None:
+            self._scan_parameters["enabled"] = val
 
     @property
     def scan_output_channel(self) -> OutputChannel:
         """Internal scan output channel. It can be directed to the
         piezo or laser current directly, or to the output BNCs on the DLC"""
-        num = self.dlc.laser1.scan.output_channel.get()
-        return OutputChannel(num)
+        num = self._cached_get(self._scan.output_channel)
+        return _OUTPUT_BY_VALUE[num]
 
     @scan_output_channel.setter
-    def scan_output_channel(self, val: Union[OutputChannel, str]):
+    def scan_output_channel(self, val: Union[OutputChannel, str, int]):
         """The internal scan can only act on eiter piezo or the current at any
         given time, or be directed to the DLC BNCs
-        val : {"CC", "PC", OutputChannel.CC, OutputChannel.PC}"""
-        try:
-            if isinstance(val, OutputChannel):
-                num = val.value
-            elif isinstance(val, str):
-                num = OutputChannel[val.upper()].value
-            else:
-                raise KeyError
-        except KeyError:
+        val : {"CC", "PC", "OutA", "OutB", OutputChannel.CC, OutputChannel.PC,
+               OutputChannel.OutA, OutputChannel.OutB}
+              or the numeric value of the channel"""
+        channel = _coerce_channel(val, OutputChannel)
+        if channel is None:
             raise ValueError(
-                "Channel must be 'CC', 'PC', OutputChannel.CC, or "
-                f"OutputChannel.PC (tried with '{val}')"
-            ) from KeyError
-        self.dlc.laser1.scan.output_channel.set(num)
-        self._scan_parameters["scan_output_channel"] = OutputChannel(num)
-        self._update_scan_range_attribute(OutputChannel(num))
+                "Channel must be one of 'CC', 'PC', 'OutA', 'OutB', or an "
+                f"OutputChannel or its value (tried with '{val}')"
+            )
+        self._set(self._scan.output_channel, channel.value, skip_unchanged=True)
+        # The DLC may limit the scan window to the range of the new channel
+        scan = self._scan
+        for param in (scan.amplitude, scan.offset, scan.start, scan.end):
+            self._last_set.pop(param.name, None)
+        if self._scan_parameters is not None:
+            self._scan_parameters["output channel"] = channel
+        self._update_scan_range_attribute(channel)
 
     @property
     def scan_frequency(self) -> float:
         """Internal scan frequency"""
-        return self.dlc.laser1.scan.frequency.get()
+        return self._cached_get(self._scan.frequency)
 
     @scan_frequency.setter
     def scan_frequency(self, val: float):
-        val = float(val)
-        _check_value(val, "scan frequency", (self._lims["fmin"], self._lims["fmax"]))
-        self.dlc.laser1.scan.frequency.set(val)
-        self._scan_parameters["frequency"] = val
+        self._load_scan_state()
+        val = _checked_float(val, "scan frequency", self._frange)
+        self._set_scan("frequency", val)
 
     @property
     def scan_amplitude(self) -> float:
         """Internal scan amplitude"""
-        return self.dlc.laser1.scan.amplitude.get()
+        return self._cached_get(self._scan.amplitude)
 
     @scan_amplitude.setter
     def scan_amplitude(self, val: float):
         val = float(val)
-        offset = self.scan_offset
-        new_range = [offset - val / 2, offset + val / 2]
-        if min(new_range) < self._scan_range[0] or max(new_range) > self._scan_range[1]:
-            raise OutOfRangeError(new_range, "scan", self._scan_range)
-        self.dlc.laser1.scan.amplitude.set(val)
-        self._scan_parameters["amplitude"] = val
+        self._load_scan_state()
+        offset = self._scan_parameters["offset"]
+        _check_scan_window(offset, val, self._scan_range)
+        self._set_scan("amplitude", val)
 
     @property
     def scan_offset(self) -> float:
         """Internal scan offset value"""
-        return self.dlc.laser1.scan.offset.get()
+        return self._cached_get(self._scan.offset)
 
     @scan_offset.setter
     def scan_offset(self, val: float):
         val = float(val)
-        amplitude = self.scan_amplitude
-        new_range = [val - amplitude / 2, val + amplitude / 2]
-        if min(new_range) < self._scan_range[0] or max(new_range) > self._scan_range[1]:
-            raise OutOfRangeError(new_range, "scan", self._scan_range)
-        self.dlc.laser1.scan.offset.set(val)
-        self._scan_parameters["offset"] = val
+        self._load_scan_state()
+        amplitude = self._scan_parameters["amplitude"]
+        _check_scan_window(val, amplitude, self._scan_range)
+        self._set_scan("offset", val)
 
     @property
     def scan_start(self) -> float:
         """Internal scan start value"""
-        return self.dlc.laser1.scan.start.get()
+        return self._cached_get(self._scan.start)
 
     @scan_start.setter
     def scan_start(self, val: float):
-        val = float(val)
-        _check_value(val, "scan start", self._scan_range)
-        self.dlc.laser1.scan.start.set(val)
-        self._scan_parameters["start"] = val
+        self._load_scan_state()
+        val = _checked_float(val, "scan start", self._scan_range)
+        self._set_scan("start", val)
 
     @property
     def scan_end(self) -> float:
         """Interal scan end value"""
-        return self.dlc.laser1.scan.end.get()
+        return self._cached_get(self._scan.end)
 
     @scan_end.setter
     def scan_end(self, val: float):
-        val = float(val)
-        _check_value(val, "scan end", self._scan_range)
-        self.dlc.laser1.scan.end.set(val)
-        self._scan_parameters["end"] = val
+        self._load_scan_state()
+        val = _checked_float(val, "scan end", self._scan_range)
+        self._set_scan("end", val)
+
+    def _set_scan(self, key: str, val: float):
+        """Write a checked value of the internal scan and update
+        ``_scan_parameters``, ``key`` being the name of the parameter both in
+        the SDK's scan object and in ``_scan_parameters``"""
+        self._set(getattr(self._scan, key), val, skip_unchanged=True)
+        self._scan_parameters[key] = val
+        if key != "frequency":
+            self._scan_window_changed(key)
+
+    def _scan_window_changed(self, changed: str):
+        """Update the scan window entries in ``_scan_parameters`` that the DLC
+        derives from the ``changed`` one (start and end follow offset and
+        amplitude, and vice versa), so that the range checks in the setters can
+        use the dictionary instead of querying the DLC"""
+        params = self._scan_parameters
+        # The DLC pushes the derived values with a delay, so do not keep the
+        # subscribed ones until then
+        scan = self._scan
+        for param in (scan.amplitude, scan.offset, scan.start, scan.end):
+            self._cache.pop(param.name, None)
+        # The derived values were not written, so their next write must go
+        # through
+        if changed in ("offset", "amplitude"):
+            derived = (scan.start, scan.end)
+        else:
+            derived = (scan.offset, scan.amplitude)
+        for param in derived:
+            self._last_set.pop(param.name, None)
+        if changed in ("offset", "amplitude"):
+            params["start"] = params["offset"] - params["amplitude"] / 2
+            params["end"] = params["offset"] + params["amplitude"] / 2
+        else:
+            params["amplitude"] = params["end"] - params["start"]
+            params["offset"] = (params["start"] + params["end"]) / 2
+
+    def set_scan(
+        self,
+        offset: Union[float, None] = None,
+        amplitude: Union[float, None] = None,
+        start: Union[float, None] = None,
+        end: Union[float, None] = None,
+        frequency: Union[float, None] = None,
+    ):
+        """Set several internal scan settings together: the new settings are
+        checked before any of them is written, and they are written in one
+        request
+
+        The scan window is given either by ``offset`` and/or ``amplitude``, or
+        by ``start`` and/or ``end``, the settings not given are kept
+
+        Raises
+        ------
+        ValueError
+            If both offset/amplitude and start/end are given, or the scan end
+            would be below the scan start
+        OutOfRangeError
+            If the frequency is outside its permitted range, or the scan window
+            would extend outside of the scan range
+        """
+        if (offset is not None or amplitude is not None) and (
+            start is not None or end is not None
+        ):
+            raise ValueError(
+                "Give the scan window either by offset/amplitude or by start/end"
+            )
+        self._load_scan_state()
+        current = self._scan_parameters
+        if start is not None or end is not None:
+            start = current["start"] if start is None else float(start)
+            end = current["end"] if end is None else float(end)
+            if end < start:
+                raise ValueError(
+                    f"The scan end ({end}) must not be below the scan start ({start})"
+                )
+            offset, amplitude = (start + end) / 2, end - start
+        else:
+            offset = None if offset is None else float(offset)
+            amplitude = None if amplitude is None else float(amplitude)
+        new_offset = current["offset"] if offset is None else offset
+        new_amplitude = current["amplitude"] if amplitude is None else amplitude
+        _check_scan_window(new_offset, new_amplitude, self._scan_range)
+        to_set, values = [], []
+        if frequency is not None:
+            frequency = _checked_float(frequency, "scan frequency", self._frange)
+            to_set.append(self._scan.frequency)
+            values.append(frequency)
+        for param, val in self._scan_window_writes(offset, amplitude):
+            to_set.append(param)
+            values.append(val)
+        try:
+            self._batch_set(to_set, values)
+        except BaseException:
+            # Some of the values may have been written, read the stored values
+            # again when they are next needed
+            self._forget_settings()
+            raise
+        if frequency is not None:
+            current["frequency"] = frequency
+        if offset is not None or amplitude is not None:
+            current["offset"] = new_offset
+            current["amplitude"] = new_amplitude
+            self._scan_window_changed("offset")
+
+    def set_scan_window(self, offset: float, amplitude: float):
+        """Set the internal scan offset and amplitude together: the new window
+        is checked once and both values are written in one request, see also
+        ``set_scan()``
+
+        Raises
+        ------
+        OutOfRangeError
+            If the scan window would extend outside of the scan range
+        """
+        self.set_scan(offset=offset, amplitude=amplitude)
+
+    def _scan_window_writes(
+        self, offset: Union[float, None], amplitude: Union[float, None]
+    ) -> List[Tuple[Any, float]]:
+        """The SDK parameter objects and values for writing a new scan offset
+        and/or amplitude (``None`` if unchanged), ordered so that the window is
+        shrunk before it is moved, and moved before it grows, keeping the
+        intermediate state within the range too"""
+        writes = []
+        if offset is not None:
+            writes.append((self._scan.offset, offset))
+        if amplitude is not None:
+            if amplitude < self._scan_parameters["amplitude"]:
+                writes.insert(0, (self._scan.amplitude, amplitude))
+            else:
+                writes.append((self._scan.amplitude, amplitude))
+        return writes
+
+
+# Close the pooled sessions cleanly when the interpreter exits
+atexit.register(DLCcontrol.shutdown_pool)
+
+
+class AsyncDLCcontrol:
+    """Asyncio interface to ``DLCcontrol``: each call to the laser is run in a
+    worker thread, so other coroutines (for instance controlling another DLC)
+    keep running while waiting for the network. Calls to the same laser are
+    serialised as they share one connection
+
+    Parameters
+    ----------
+    ip : str, optional
+        IP address of the DLC unit
+    **kwargs
+        Passed on to ``DLCcontrol`` (except ``open_on_init``, the connection is
+        opened with ``await open()`` or by using the object as an async context
+        manager)
+
+    Example
+    -------
+
+        async def main():
+            async with AsyncDLCcontrol(ip) as dlc:
+                await dlc.set("scan_frequency", 20)
+                params = await dlc.get_all_parameters()
+
+    """
+
+    def __init__(self, ip: Union[str, None] = None, **kwargs):
+        kwargs["open_on_init"] = False
+        self.control = DLCcontrol(ip, **kwargs)
+        """The underlying ``DLCcontrol`` object"""
+        self._lock = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _run(self, func, *args):
+        """Run the blocking ``func(*args)`` in a worker thread"""
+        if self._lock is None:
+            # Created here to bind to the running event loop
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, functools.partial(func, *args))
+
+    async def open(self):
+        """Open the connection to the laser, see ``DLCcontrol.open()``"""
+        await self._run(self.control.open)
+
+    async def close(self):
+        """Close the connection to the DLC"""
+        await self._run(self.control.close)
+
+    async def get(self, name: str) -> Any:
+        """Read one of the properties of ``DLCcontrol``, e.g.
+        ``await dlc.get("scan_offset")``"""
+        return await self._run(getattr, self.control, name)
+
+    async def set(self, name: str, val: Any):
+        """Set one of the properties of ``DLCcontrol``, e.g.
+        ``await dlc.set("scan_offset", 50)``"""
+        await self._run(setattr, self.control, name, val)
+
+    async def get_scan_parameters(self) -> dict:
+        """See ``DLCcontrol.get_scan_parameters()``"""
+        return await self._run(self.control.get_scan_parameters)
+
+    async def get_remote_parameters(self) -> dict:
+        """See ``DLCcontrol.get_remote_parameters()``"""
+        return await self._run(self.control.get_remote_parameters)
+
+    async def get_all_parameters(self) -> dict:
+        """See ``DLCcontrol.get_all_parameters()``"""
+        return await self._run(self.control.get_all_parameters)
+
+    async def set_scan(self, **settings):
+        """See ``DLCcontrol.set_scan()``"""
+        await self._run(functools.partial(self.control.set_scan, **settings))
+
+    async def set_parameters(self, params: dict):
+        """See ``DLCcontrol.set_parameters()``"""
+        await self._run(self.control.set_parameters, params)
+
+    async def save_parameters(self, fname: str, params: Union[dict, None] = None):
+        """See ``DLCcontrol.save_parameters()``"""
+        await self._run(self.control.save_parameters, fname, params)
 
 
 def freq_per_sec(
@@ -778,41 +1825,46 @@ def freq_per_sec_from_params(params: dict, calibration: float) -> float:
 # An example programme ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ ##
 
 
-def step_through_scan_range(ip=IP, steps: int = 20, dlc: DLCcontrol = None):
+def _scan_targets(end: float, amplitude: float, steps: int) -> List[float]:
+    """The ``steps`` evenly spaced values from ``end`` down to
+    ``end - amplitude`` (both included)"""
+    step = -amplitude / (steps - 1) if steps > 1 else 0
+    return [end + i * step for i in range(steps)]
+
+
+def step_through_scan_range(dlc: DLCcontrol, steps: int = 20):
     """A simple programme: Step through the internal voltage/current
     scan range currently in use
 
     Parameters
     ----------
-    ip : str
-        IP of the DLC if a connection should be opened
+    dlc : DLCcontrol
+        An open connection to the DLC
     steps : int, default 20
         The number of steps to divide the amplitude into
-    dlc : DLCcontrol, optional
-        If a ``DLCcontrol`` object is provided, a new one will not be created
     """
-    if dlc is None:
-        dlc = DLCcontrol(ip)
-        close_flag = True
-    else:
-        close_flag = False
     # Read initial values
     initial_end = dlc.scan_end
     initial_offset = dlc.scan_offset
     initial_amplitude = dlc.scan_amplitude
-    # Define range to scan
-    step_range = np.linspace(0, -initial_amplitude, steps)
+    # Define the offsets to step through
+    targets = _scan_targets(initial_end, initial_amplitude, steps)
+    messages = [f"{i}: change to {target:.3f}V" for i, target in enumerate(targets)]
     try:
         dlc.scan_amplitude = 0
-        for i, change in enumerate(step_range):
+        # Schedule the steps one second apart regardless of the time it takes
+        # to set the offset, so that the cadence does not drift
+        next_step = time.monotonic()
+        for target, message in zip(targets, messages):
             try:
-                print(f"{i}: change to {initial_end+change:.3f}V")
+                print(message)
                 try:
-                    dlc.scan_offset = initial_end + change
+                    dlc.scan_offset = target
                 except OutOfRangeError as err:
                     print(err)
                     break
-                time.sleep(1)
+                next_step += 1
+                time.sleep(max(0, next_step - time.monotonic()))
             except KeyboardInterrupt:
                 print("Stopping scan")
                 break
@@ -820,13 +1872,63 @@ def step_through_scan_range(ip=IP, steps: int = 20, dlc: DLCcontrol = None):
         print("Restore initial state")
         dlc.scan_offset = initial_offset
         dlc.scan_amplitude = initial_amplitude
-        if close_flag:
-            dlc.close()
+
+
+def cli_step_through(ip: str = IP, steps: int = 20):
+    """Connect to the DLC at ``ip`` and run ``step_through_scan_range()``
+
+    Parameters
+    ----------
+    ip : str, default is the module constant ``IP``
+        IP address of the DLC unit
+    steps : int, default 20
+        The number of steps to divide the amplitude into
+    """
+    with DLCcontrol(ip) as dlc:
+        step_through_scan_range(dlc, steps)
+
+
+async def step_through_scan_range_async(dlc: AsyncDLCcontrol, steps: int = 20):
+    """Asyncio version of ``step_through_scan_range()``, other coroutines can
+    run while the laser settles at each step
+
+    Parameters
+    ----------
+    dlc : AsyncDLCcontrol
+        An open connection to the DLC
+    steps : int, default 20
+        The number of steps to divide the amplitude into
+    """
+    # Read initial values
+    initial_end = await dlc.get("scan_end")
+    initial_offset = await dlc.get("scan_offset")
+    initial_amplitude = await dlc.get("scan_amplitude")
+    # Define the offsets to step through
+    targets = _scan_targets(initial_end, initial_amplitude, steps)
+    messages = [f"{i}: change to {target:.3f}V" for i, target in enumerate(targets)]
+    try:
+        await dlc.set("scan_amplitude", 0)
+        next_step = time.monotonic()
+        for target, message in zip(targets, messages):
+            print(message)
+            try:
+                await dlc.set("scan_offset", target)
+            except OutOfRangeError as err:
+                print(err)
+                break
+            next_step += 1
+            await asyncio.sleep(max(0, next_step - time.monotonic()))
+    finally:
+        print("Restore initial state")
+        await dlc.set("scan_offset", initial_offset)
+        await dlc.set("scan_amplitude", initial_amplitude)
 
 
 def command_line_programme():
     """Command line use of the module: run ``python dlccontrol.py -h`` to see
     the options"""
+    import argparse
+
     parser = argparse.ArgumentParser(description="A few useful laser control funtions")
     parser.add_argument(
         "-i",
@@ -875,12 +1977,13 @@ def command_line_programme():
     with DLCcontrol(ip) as dlc:
         if args.emission:
             dlc.verbose_emission_status()
-        if args.parameters:
-            dlc.get_all_parameters(verbose=True)
+        if args.parameters or args.fname is not None:
+            # Read once for both printing and saving
+            params = dlc.get_all_parameters(verbose=args.parameters)
         if args.fname is not None:
-            dlc.save_parameters(args.folder + args.fname)
+            dlc.save_parameters(args.folder + args.fname, params)
         if args.steps:
-            step_through_scan_range(ip, args.steps, dlc)
+            step_through_scan_range(dlc, args.steps)
 
 
 if __name__ == "__main__":
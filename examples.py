@@ -13,41 +13,46 @@ MY_LASER_IP = "169.254.99.22"
 
 
 def properties_demo(ip=MY_LASER_IP):
-    with ctrl.DLCcontrol(ip) as dlc:
-        if dlc.wl_setting_present:
+    # keep_open leaves the session open when the block ends, so that the
+    # following examples reuse it instead of connecting again
+    with ctrl.DLCcontrol(ip, keep_open=True) as dlc:
+        if dlc.wl_control_available:
             dlc.wavelength_setpoint = 1550
             actual_wl = dlc.wavelength_actual
-        if dlc.temp_setting_present:
+        if dlc.temp_control_available:
             dlc.temp_setpoint = 20
             actual_temp = dlc.temp_actual
         # Set up a the analogue remote control sweeping the current with the
-        # on input Fine1
-        dlc.remote_select = "CC"
-        dlc.remote_signal = "Fine1"
-        dlc.remote_factor = 10
-        dlc.remote_enable = True
-        # Use the internal voltage scan and gradually increase the scan amplitude
+        # on input Fine1 (the settings are written together at the end of the
+        # transaction block)
+        with dlc.transaction():
+            dlc.remote_select = "CC"
+            dlc.remote_signal = "Fine1"
+            dlc.remote_factor = 10
+            dlc.remote_enabled = True
+        # Use the internal voltage scan: the DLC sweeps the piezo itself, so
+        # set the frequency and amplitude together in one request, and restore
+        # the amplitude after a while
         dlc.scan_output_channel = "PC"
         initial_amplitude = dlc.scan_amplitude
-        dlc.scan_frequency = 20.5
-        for i in range(10):
-            dlc.scan_amplitude = i
+        dlc.set_scan(frequency=20.5, amplitude=9)
+        time.sleep(1)
         dlc.scan_amplitude = initial_amplitude
 
 
 def show_all_parameters(ip=MY_LASER_IP):
-    with ctrl.DLCcontrol(ip) as dlc:
+    with ctrl.DLCcontrol(ip, keep_open=True) as dlc:
         print("All parameters that can be controlled with this wrapper")
         dlc.get_all_parameters(verbose=True)
 
 
 def save_all_parameters(ip=MY_LASER_IP, fname="laser_parameters"):
-    with ctrl.DLCcontrol(ip) as dlc:
+    with ctrl.DLCcontrol(ip, keep_open=True) as dlc:
         dlc.save_parameters(fname)
 
 
 def emission_control(ip=MY_LASER_IP):
-    with ctrl.DLCcontrol(ip) as dlc:
+    with ctrl.DLCcontrol(ip, keep_open=True) as dlc:
         print("\nEmission status:\n")
         dlc.verbose_emission_status()
         print("\n(!) WARNING Enabling laser current in three seconds..\n")
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the pipelined requests against a minimal fake DeCoP server
+
+Run with ``python -m unittest`` (or pytest), requires the Toptica SDK
+"""
+
+import random
+import re
+import socket
+import threading
+import unittest
+
+import dlccontrol as ctrl
+
+
+class FakeDLC:
+    """Answers ``param-ref`` and ``param-set!`` on the command line port of a
+    loopback address, and accepts connections on the monitoring line port"""
+
+    def __init__(self, values: dict, unavailable=(), refused=()):
+        self.values = dict(values)
+        self.unavailable = set(unavailable)
+        self.refused = set(refused)
+        self.commands = []
+        self.ip = f"127.{random.randint(1, 254)}.{random.randint(1, 254)}.1"
+        self._servers = [self._serve(1998, self._command_line)]
+        self._servers.append(self._serve(1999, self._monitoring_line))
+
+    def _serve(self, port: int, handler) -> socket.socket:
+        server = socket.socket()
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server.bind((self.ip, port))
+        server.listen()
+
+        def accept():
+            while True:
+                try:
+                    conn, _ = server.accept()
+                except OSError:
+                    return
+                threading.Thread(target=handler, args=(conn,), daemon=True).start()
+
+        threading.Thread(target=accept, daemon=True).start()
+        return server
+
+    def _reply(self, line: str) -> str:
+        self.commands.append(line)
+        ref = re.match(r"\(param-ref '([\w:-]+)\)", line)
+        if ref:
+            name = ref.group(1)
+            if name in self.unavailable:
+                return "Error: -20 unavailable"
+            return self.values.get(name, "0")
+        name, val = re.match(r"\(param-set! '([\w:-]+) (.*)\)", line).groups()
+        if name in self.refused:
+            return "-7"
+        self.values[name] = val
+        return "0"
+
+    def _command_line(self, conn: socket.socket):
+        conn.sendall(b"DeCoP fake\r\n> ")
+        buffer = b""
+        while True:
+            try:
+                data = conn.recv(4096)
+            except OSError:
+                return
+            if not data:
+                return
+            buffer += data
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                conn.sendall(self._reply(line.decode()).encode() + b"\r\n> ")
+
+    def _monitoring_line(self, conn: socket.socket):
+        while conn.recv(4096):
+            pass
+
+    def close(self):
+        for server in self._servers:
+            server.close()
+
+
+class TestPipelinedRequests(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeDLC(
+            {
+                "laser1:scan:frequency": "20.0",
+                "laser1:scan:amplitude": "10.0",
+                "laser1:scan:offset": "60.0",
+                "laser1:scan:enabled": "#t",
+                "laser1:scan:output-channel": "50",
+            },
+            unavailable={"laser1:scan:start"},
+            refused={"laser1:scan:amplitude"},
+        )
+        self.dlc = ctrl.DLCcontrol(self.fake.ip, discover_wl_or_temp_control=False)
+        self.fake.commands.clear()
+
+    def tearDown(self):
+        self.dlc.close()
+        self.fake.close()
+
+    def test_batched_reads(self):
+        scan = self.dlc._scan
+        values = self.dlc._batch_get(
+            [scan.frequency, scan.enabled, "laser1:scan:output-channel"]
+        )
+        self.assertEqual(values, [20.0, True, 50])
+        self.assertEqual(
+            self.fake.commands,
+            [
+                "(param-ref 'laser1:scan:frequency)",
+                "(param-ref 'laser1:scan:enabled)",
+                "(param-ref 'laser1:scan:output-channel)",
+            ],
+        )
+
+    def test_error_reply_within_batch(self):
+        scan = self.dlc._scan
+        with self.assertRaises(ctrl.decop.DecopError):
+            self.dlc._batch_get([scan.frequency, scan.start, scan.offset])
+        # All replies were read, so the next request gets its own reply
+        self.assertEqual(self.dlc._batch_get([scan.amplitude]), [10.0])
+
+    def test_batch_set_status(self):
+        scan = self.dlc._scan
+        with self.assertRaisesRegex(ctrl.decop.DecopError, "laser1:scan:amplitude"):
+            self.dlc._batch_set(
+                [scan.frequency, scan.amplitude, scan.offset], [25.0, 30.0, 61.0]
+            )
+        # The other values of the batch are still written
+        self.assertEqual(self.fake.values["laser1:scan:frequency"], "25.0")
+        self.assertEqual(self.fake.values["laser1:scan:offset"], "61.0")
+        self.assertEqual(self.fake.values["laser1:scan:amplitude"], "10.0")
+        self.assertEqual(self.dlc._batch_get([scan.offset]), [61.0])
+
+
+if __name__ == "__main__":
+    unittest.main()